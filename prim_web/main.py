@@ -8,27 +8,45 @@ Features
 - Scans for mesh.obj files in the dataset structure and exposes them through a JSON API.
 - Streams OBJ files to the frontend for interactive viewing with three.js.
 - Persists the last used dataset path and the latest scan into a cache folder.
+
+Optional dependencies
+---------------------
+- orjson: faster JSON encoding for the API (falls back to json).
+- xxhash: faster id hashing during scans (falls back to hashlib.blake2b).
 """
 
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import functools
 import hashlib
+import heapq
 import http.server
 import json
 import mimetypes
 import numpy as np
 import os
+import queue
 import shutil
-import socketserver
+import tempfile
 import threading
 import time
 import urllib.parse
 import webbrowser
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speedup
+    xxhash = None
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -37,28 +55,91 @@ CACHE_DIR = BASE_DIR / "cache"
 DEFAULT_DATASET_ROOT = Path(__file__).resolve().parent.parent / "hl2ss-lk" / "viewer" / "dataset"
 LAST_DATASET_FILE = CACHE_DIR / "last_dataset.txt"
 CACHE_INDEX_FILE = CACHE_DIR / "mesh_index.json"
+# Scanning is I/O-latency bound, so oversubscribe the CPU count to hide syscall stalls.
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Each connection gets its own thread; cap how many are open at once. Idle keep-alive
+# connections hold a slot, so leave room for several browser tabs (~6 connections each).
+SERVER_MAX_CONNECTIONS = 64
+# Keep-alive connections are dropped after waiting this many seconds for the next request.
+KEEP_ALIVE_TIMEOUT = 5
+# Page-cache prewarming after a scan is limited to the most recently modified meshes,
+# so a large dataset does not evict everything else from memory.
+PREFETCH_MAX_MESHES = 32
 mimetypes.add_type("application/javascript", ".js")
 
 
-@dataclass
+def _json_dumps(payload: object) -> bytes:
+    """Encode payload as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _content_type_for_suffix(suffix: str) -> str:
+    return mimetypes.guess_type("file" + suffix)[0] or "application/octet-stream"
+
+
+def _guess_content_type(name: str) -> str:
+    """mimetypes.guess_type for a file name, memoized per extension."""
+    return _content_type_for_suffix(os.path.splitext(name)[1].lower())
+
+
+def _path_id(path: Union[str, Path]) -> str:
+    """Return the opaque 12-hex-char id used in URLs for a dataset file."""
+    return _path_ids([path])[0]
+
+
+def _path_ids(paths: Iterable[Union[str, Path]]) -> List[str]:
+    """Batch form of _path_id for a whole directory listing.
+
+    Resolves the hash function once and runs a tight comprehension, rather than
+    paying the lookups and call overhead once per file.
+    """
+    fsencode = os.fsencode
+    if xxhash is not None:
+        hexdigest = xxhash.xxh3_64_hexdigest
+        return [hexdigest(fsencode(path))[:12] for path in paths]
+    # blake2b's digest_size=6 yields the 12 hex chars directly, no slicing needed.
+    blake2b = hashlib.blake2b
+    return [blake2b(fsencode(path), digest_size=6).hexdigest() for path in paths]
+
+
+@dataclass(slots=True)
 class PreviewAsset:
     id: str
     name: str
-    rel_path: str
+    rel_path: str  # forward-slash form, relative to the dataset root
     size: int
     mtime: float
+    content_type: str  # served as Content-Type; not part of the JSON form
+    # Serialized form, built on first as_dict() call and reused afterwards.
+    _dict: Optional[Dict[str, object]] = field(default=None, init=False, repr=False, compare=False)
 
     def as_dict(self) -> Dict[str, object]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "rel_path": self.rel_path.replace("\\", "/"),
-            "size": self.size,
-            "mtime": self.mtime,
-        }
+        if self._dict is None:
+            self._dict = {
+                "id": self.id,
+                "name": self.name,
+                "rel_path": self.rel_path,
+                "size": self.size,
+                "mtime": self.mtime,
+            }
+        return self._dict
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "PreviewAsset":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            rel_path=data["rel_path"],
+            size=data["size"],
+            mtime=data["mtime"],
+            content_type=_guess_content_type(data["name"]),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class RIRAsset:
     id: str
     name: str
@@ -66,19 +147,35 @@ class RIRAsset:
     size: int
     mtime: float
     channel: str
+    content_type: str
+    _dict: Optional[Dict[str, object]] = field(default=None, init=False, repr=False, compare=False)
 
     def as_dict(self) -> Dict[str, object]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "rel_path": self.rel_path.replace("\\", "/"),
-            "size": self.size,
-            "mtime": self.mtime,
-            "channel": self.channel,
-        }
+        if self._dict is None:
+            self._dict = {
+                "id": self.id,
+                "name": self.name,
+                "rel_path": self.rel_path,
+                "size": self.size,
+                "mtime": self.mtime,
+                "channel": self.channel,
+            }
+        return self._dict
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "RIRAsset":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            rel_path=data["rel_path"],
+            size=data["size"],
+            mtime=data["mtime"],
+            channel=data["channel"],
+            content_type=_guess_content_type(data["name"]),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshEntry:
     id: str
     name: str
@@ -89,30 +186,88 @@ class MeshEntry:
     rirs: List["RIRAsset"]
     mic_position: Optional[List[float]]
     source_position: Optional[List[float]]
+    _dict: Optional[Dict[str, object]] = field(default=None, init=False, repr=False, compare=False)
 
     def as_dict(self) -> Dict[str, object]:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "rel_path": self.rel_path.replace("\\", "/"),
-            "size": self.size,
-            "mtime": self.mtime,
-            "previews": [preview.as_dict() for preview in self.previews],
-            "rirs": [rir.as_dict() for rir in self.rirs],
-            "markers": {
-                "mic": self.mic_position,
-                "source": self.source_position,
-            },
-        }
+        if self._dict is None:
+            self._dict = {
+                "id": self.id,
+                "name": self.name,
+                "rel_path": self.rel_path,
+                "size": self.size,
+                "mtime": self.mtime,
+                "previews": [preview.as_dict() for preview in self.previews],
+                "rirs": [rir.as_dict() for rir in self.rirs],
+                "markers": {
+                    "mic": self.mic_position,
+                    "source": self.source_position,
+                },
+            }
+        return self._dict
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "MeshEntry":
+        markers = data.get("markers") or {}
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            rel_path=data["rel_path"],
+            size=data["size"],
+            mtime=data["mtime"],
+            previews=[PreviewAsset.from_dict(preview) for preview in data["previews"]],
+            rirs=[RIRAsset.from_dict(rir) for rir in data["rirs"]],
+            mic_position=markers.get("mic"),
+            source_position=markers.get("source"),
+        )
+
+
+# id -> (absolute path, indexed asset); the asset carries size/mtime from the scan.
+MeshMap = Dict[str, Tuple[Path, MeshEntry]]
+PreviewMap = Dict[str, Tuple[Path, PreviewAsset]]
+RIRMap = Dict[str, Tuple[Path, RIRAsset]]
+
+
+@dataclass(slots=True)
+class ScanSnapshot:
+    """Filesystem state seen by a scan, used to validate the on-disk index cache.
+
+    Every value is taken before the folder is listed or the file is read, so a change
+    racing with the scan always shows up as a mismatch on the next startup.
+    """
+
+    dir_mtimes: Dict[str, int] = field(default_factory=dict)  # folder -> st_mtime_ns
+    file_stats: Dict[str, List[int]] = field(default_factory=dict)  # file -> [st_mtime_ns, st_size]
+
+    def record_file(self, path: Union[str, Path], stat: os.stat_result) -> None:
+        self.file_stats[str(path)] = [stat.st_mtime_ns, stat.st_size]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"dirs": self.dir_mtimes, "files": self.file_stats}
+
+    def is_current(self) -> bool:
+        """Return True if every recorded folder and file is unchanged on disk."""
+        try:
+            for path, mtime in self.dir_mtimes.items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+            for path, (mtime, size) in self.file_stats.items():
+                stat = os.stat(path)
+                if stat.st_mtime_ns != mtime or stat.st_size != size:
+                    return False
+        except OSError:
+            return False
+        return True
 
 
 class AppState:
     def __init__(self, dataset_root: Path):
         self.dataset_root = dataset_root
         self.entries: List[MeshEntry] = []
-        self.path_map: Dict[str, Path] = {}
-        self.preview_map: Dict[str, Path] = {}
-        self.rir_map: Dict[str, Path] = {}
+        self.path_map: MeshMap = {}
+        self.preview_map: PreviewMap = {}
+        self.rir_map: RIRMap = {}
+        # Pre-serialized JSON array of entries, rebuilt whenever the index changes.
+        self.entries_json: bytes = b"[]"
         self.lock = threading.Lock()
 
 
@@ -161,69 +316,184 @@ def choose_dataset_root(args_dataset: Optional[str], allow_dialog: bool = True)
     return candidate
 
 
-def _collect_previews(mesh_path: Path, dataset_root: Path) -> Tuple[List[PreviewAsset], Dict[str, Path]]:
-    """Return preview assets (png thumbnails) living next to the mesh."""
+DirListing = Dict[str, os.DirEntry]
+
+
+def _list_dir_cached(path: Path, cache: Dict[str, DirListing]) -> DirListing:
+    """Return name->DirEntry for path, scanning each directory at most once per cache.
+
+    Missing or unreadable directories map to an empty listing. The cache is shared by
+    the scan workers; a racing duplicate scandir is harmless.
+    """
+    key = str(path)
+    listing = cache.get(key)
+    if listing is None:
+        try:
+            with os.scandir(key) as it:
+                listing = {entry.name: entry for entry in it}
+        except OSError:
+            listing = {}
+        cache[key] = listing
+    return listing
+
+
+def _find_sibling_dir(mesh_path: Path, name: str, cache: Dict[str, DirListing]) -> Optional[Path]:
+    """Locate <name>/ next to the mesh folder, falling back to inside it."""
+    # Typical layout: .../<session>/<source>/mesh/mesh.obj -> sibling <name>/ next to mesh/.
+    for parent in (mesh_path.parent.parent, mesh_path.parent):
+        entry = _list_dir_cached(parent, cache).get(name)
+        if entry is not None and entry.is_dir():
+            return Path(entry.path)
+    return None
+
+
+def _list_files(directory: Path, suffix: str, cache: Dict[str, DirListing]) -> List[os.DirEntry]:
+    """Return regular files in directory ending with suffix, sorted by name."""
+    files = [
+        dir_entry
+        for name, dir_entry in _list_dir_cached(directory, cache).items()
+        if name.endswith(suffix) and dir_entry.is_file(follow_symlinks=False)
+    ]
+    files.sort(key=lambda dir_entry: dir_entry.name)
+    return files
+
+
+def _collect_previews(
+    mesh_path: Path,
+    dataset_root: Path,
+    cache: Optional[Dict[str, DirListing]] = None,
+    snapshot: Optional[ScanSnapshot] = None,
+) -> Tuple[List[PreviewAsset], PreviewMap]:
+    """Return preview assets (png thumbnails) living next to the mesh.
+
+    Each file's stat is recorded in snapshot, if given, so rewrites invalidate the
+    cached index.
+    """
     preview_assets: List[PreviewAsset] = []
-    preview_map: Dict[str, Path] = {}
-
-    # Typical layout: .../<session>/<source>/mesh/mesh.obj -> sibling image/ contains PNGs.
-    candidate = mesh_path.parent.parent / "image"
-    if not candidate.exists():
-        candidate = mesh_path.parent / "image"
-
-    if candidate.exists():
-        for png in sorted(candidate.glob("*.png")):
-            if not png.is_file():
-                continue
-            stat = png.stat()
-            preview_id = hashlib.sha1(str(png).encode("utf-8")).hexdigest()[:12]
+    preview_map: PreviewMap = {}
+    if cache is None:
+        cache = {}
+
+    candidate = _find_sibling_dir(mesh_path, "image", cache)
+    if candidate is not None:
+        # Work on DirEntry names/paths directly; the stat comes from the listing.
+        rel_dir = candidate.relative_to(dataset_root).as_posix()
+        files = _list_files(candidate, ".png", cache)
+        ids = _path_ids([dir_entry.path for dir_entry in files])
+        for dir_entry, preview_id in zip(files, ids):
+            stat = dir_entry.stat()
+            if snapshot is not None:
+                snapshot.record_file(dir_entry.path, stat)
             asset = PreviewAsset(
                 id=preview_id,
-                name=png.name,
-                rel_path=str(png.relative_to(dataset_root)),
+                name=dir_entry.name,
+                rel_path=f"{rel_dir}/{dir_entry.name}",
                 size=stat.st_size,
                 mtime=stat.st_mtime,
+                content_type=_guess_content_type(dir_entry.name),
             )
             preview_assets.append(asset)
-            preview_map[preview_id] = png
+            preview_map[preview_id] = (Path(dir_entry.path), asset)
 
     return preview_assets, preview_map
 
 
-def _collect_rirs(mesh_path: Path, dataset_root: Path) -> Tuple[List[RIRAsset], Dict[str, Path]]:
-    """Return RIR audio files (wav) living next to the mesh."""
+def _collect_rirs(
+    mesh_path: Path,
+    dataset_root: Path,
+    cache: Optional[Dict[str, DirListing]] = None,
+    snapshot: Optional[ScanSnapshot] = None,
+) -> Tuple[List[RIRAsset], RIRMap]:
+    """Return RIR audio files (wav) living next to the mesh; see _collect_previews."""
     rir_assets: List[RIRAsset] = []
-    rir_map: Dict[str, Path] = {}
-
-    candidate = mesh_path.parent.parent / "audio"
-    if not candidate.exists():
-        candidate = mesh_path.parent / "audio"
-
-    if candidate.exists():
-        for wav in sorted(candidate.glob("*.wav")):
-            if not wav.is_file():
-                continue
-            stat = wav.stat()
-            rir_id = hashlib.sha1(str(wav).encode("utf-8")).hexdigest()[:12]
+    rir_map: RIRMap = {}
+    if cache is None:
+        cache = {}
+
+    candidate = _find_sibling_dir(mesh_path, "audio", cache)
+    if candidate is not None:
+        rel_dir = candidate.relative_to(dataset_root).as_posix()
+        files = _list_files(candidate, ".wav", cache)
+        ids = _path_ids([dir_entry.path for dir_entry in files])
+        for dir_entry, rir_id in zip(files, ids):
+            stat = dir_entry.stat()
+            if snapshot is not None:
+                snapshot.record_file(dir_entry.path, stat)
             asset = RIRAsset(
                 id=rir_id,
-                name=wav.name,
-                rel_path=str(wav.relative_to(dataset_root)),
+                name=dir_entry.name,
+                rel_path=f"{rel_dir}/{dir_entry.name}",
                 size=stat.st_size,
                 mtime=stat.st_mtime,
-                channel=wav.stem,
+                channel=dir_entry.name[: -len(".wav")],
+                content_type=_guess_content_type(dir_entry.name),
             )
             rir_assets.append(asset)
-            rir_map[rir_id] = wav
+            rir_map[rir_id] = (Path(dir_entry.path), asset)
 
     return rir_assets, rir_map
 
 
-def _load_markers(mesh_path: Path) -> Tuple[Optional[List[float]], Optional[List[float]]]:
+Markers = Tuple[Optional[List[float]], Optional[List[float]]]
+
+
+def _marker_rows(arr: np.ndarray) -> Markers:
+    if arr.ndim != 2 or arr.shape[1] < 3 or arr.shape[0] == 0:
+        return None, None
+
+    mic = arr[0, :3].astype(float, copy=True).tolist()
+    src = arr[-1, :3].astype(float, copy=True).tolist() if arr.shape[0] > 1 else None
+    return mic, src
+
+
+def _read_origin_rows(origin_file: Path) -> Optional[Markers]:
+    """Read only the .npy header plus the first and last rows with positioned reads.
+
+    Returns None when the file needs the general loader (unknown header version,
+    Fortran order, object dtype, truncated data, or no os.pread on this platform).
+    """
+    if not hasattr(os, "pread"):
+        return None
+
+    with origin_file.open("rb") as stream:
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+        else:
+            return None
+        if fortran_order or dtype.hasobject or len(shape) != 2:
+            return None
+
+        rows, cols = shape
+        if rows == 0 or cols < 3:
+            return None, None
+        offset = stream.tell()
+        row_bytes = cols * dtype.itemsize
+        fd = stream.fileno()
+        first = os.pread(fd, row_bytes, offset)
+        last = os.pread(fd, row_bytes, offset + (rows - 1) * row_bytes) if rows > 1 else first
+
+    if len(first) != row_bytes or len(last) != row_bytes:
+        return None
+    arr = np.frombuffer(first + last if rows > 1 else first, dtype=dtype).reshape(-1, cols)
+    return _marker_rows(arr)
+
+
+def _load_markers(
+    mesh_path: Path,
+    origin_cache: Optional[Dict[str, Markers]] = None,
+    snapshot: Optional[ScanSnapshot] = None,
+) -> Markers:
     """Load mic/source positions from session-level source_pov/position/origin.npy.
 
     - mic: first row
     - source: last row
+
+    Meshes of one session share the same origin.npy, so results are memoized in
+    origin_cache and each file is read once per scan. The stat of every file read is
+    recorded in snapshot, so in-place rewrites invalidate the cached index.
     """
 
     def _session_root(path: Path) -> Optional[Path]:
@@ -243,100 +513,373 @@ def _load_markers(mesh_path: Path) -> Tuple[Optional[List[float]], Optional[List
             candidate = mesh_path.parent / "position"
 
     origin_file = candidate / "origin.npy" if candidate else None
-    if not origin_file or not origin_file.exists():
+    if not origin_file:
         return None, None
 
+    key = str(origin_file)
+    if origin_cache is not None and key in origin_cache:
+        return origin_cache[key]
     try:
-        arr = np.load(origin_file)
-    except Exception:
+        origin_stat = os.stat(origin_file)
+    except OSError:
         return None, None
+    if snapshot is not None:
+        snapshot.record_file(origin_file, origin_stat)
 
-    if arr.ndim != 2 or arr.shape[1] < 3 or arr.shape[0] == 0:
-        return None, None
+    markers: Optional[Markers]
+    try:
+        markers = _read_origin_rows(origin_file)
+    except Exception:
+        markers = None
 
-    mic = arr[0, :3].astype(float).tolist()
-    src = arr[-1, :3].astype(float).tolist() if arr.shape[0] > 1 else None
-    return mic, src
+    if markers is None:
+        # Memory-map so only the pages holding the first and last rows are read.
+        try:
+            arr = np.load(origin_file, mmap_mode="r")
+        except Exception:
+            try:
+                arr = np.load(origin_file)
+            except Exception:
+                arr = None
+        markers = _marker_rows(arr) if arr is not None else (None, None)
 
+    if origin_cache is not None:
+        origin_cache[key] = markers
+    return markers
 
-def build_mesh_index(dataset_root: Path) -> Tuple[List[MeshEntry], Dict[str, Path], Dict[str, Path], Dict[str, Path]]:
-    """Scan dataset_root for mesh.obj files and build index + id->path map."""
-    entries: List[MeshEntry] = []
-    path_map: Dict[str, Path] = {}
-    preview_map: Dict[str, Path] = {}
-    rir_map: Dict[str, Path] = {}
 
-    if not dataset_root.exists():
-        return entries, path_map
+def _walk_for_meshes(root: Path, dir_mtimes: Optional[Dict[str, int]] = None) -> Iterator[Path]:
+    """Yield every mesh.obj below root.
 
-    for obj_path in sorted(dataset_root.rglob("mesh.obj")):
-        if not obj_path.is_file():
+    Uses an explicit stack and os.scandir so file/dir checks are answered from the
+    directory listing itself instead of one stat() per visited entry. When dir_mtimes
+    is given, each folder's mtime is recorded from a stat taken before it is listed.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "mesh.obj" and entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path)
+        except OSError:
+            # Unreadable directory; skip it like rglob would.
             continue
-        rel_path = obj_path.relative_to(dataset_root)
-        display_name = " / ".join(rel_path.parts[:-1]) or obj_path.name
-        entry_id = hashlib.sha1(str(obj_path).encode("utf-8")).hexdigest()[:12]
-        stat = obj_path.stat()
-        previews, local_preview_map = _collect_previews(obj_path, dataset_root)
-        rirs, local_rir_map = _collect_rirs(obj_path, dataset_root)
-        mic_pos, src_pos = _load_markers(obj_path)
-
-        entry = MeshEntry(
-            id=entry_id,
-            name=display_name,
-            rel_path=str(rel_path),
-            size=stat.st_size,
-            mtime=stat.st_mtime,
-            previews=previews,
-            rirs=rirs,
-            mic_position=mic_pos,
-            source_position=src_pos,
-        )
-        entries.append(entry)
-        path_map[entry_id] = obj_path
-        preview_map.update(local_preview_map)
-        rir_map.update(local_rir_map)
+
+
+def _scan_mesh(
+    obj_path: Path,
+    dataset_root: Path,
+    listing_cache: Dict[str, DirListing],
+    origin_cache: Dict[str, Markers],
+    snapshot: ScanSnapshot,
+) -> Tuple[MeshEntry, MeshMap, PreviewMap, RIRMap]:
+    """Build the index entry for a single mesh.obj plus its local id->path maps."""
+    rel_path = obj_path.relative_to(dataset_root)
+    display_name = " / ".join(rel_path.parts[:-1]) or obj_path.name
+    entry_id = _path_id(obj_path)
+    stat = obj_path.stat()
+    snapshot.record_file(obj_path, stat)
+    previews, local_preview_map = _collect_previews(obj_path, dataset_root, listing_cache, snapshot)
+    rirs, local_rir_map = _collect_rirs(obj_path, dataset_root, listing_cache, snapshot)
+    mic_pos, src_pos = _load_markers(obj_path, origin_cache, snapshot)
+
+    entry = MeshEntry(
+        id=entry_id,
+        name=display_name,
+        rel_path=rel_path.as_posix(),
+        size=stat.st_size,
+        mtime=stat.st_mtime,
+        previews=previews,
+        rirs=rirs,
+        mic_position=mic_pos,
+        source_position=src_pos,
+    )
+    # Build the serialized form here so it happens on the worker thread.
+    entry.as_dict()
+    return entry, {entry_id: (obj_path, entry)}, local_preview_map, local_rir_map
+
+
+def build_mesh_index(
+    dataset_root: Path, snapshot: Optional[ScanSnapshot] = None
+) -> Tuple[List[MeshEntry], MeshMap, PreviewMap, RIRMap]:
+    """Scan dataset_root for mesh.obj files and build index + id->path map.
+
+    The per-mesh work is dominated by filesystem latency (stat, directory listings,
+    origin.npy reads), so it is spread over a thread pool. Results are merged on the
+    calling thread in sorted path order, which keeps the output deterministic.
+
+    If snapshot is given, it receives the folder mtimes and file stats the scan saw.
+    """
+    if snapshot is None:
+        snapshot = ScanSnapshot()
+    entries: List[MeshEntry] = []
+    path_map: MeshMap = {}
+    preview_map: PreviewMap = {}
+    rir_map: RIRMap = {}
+
+    if not dataset_root.exists():
+        return entries, path_map, preview_map, rir_map
+
+    obj_paths = sorted(_walk_for_meshes(dataset_root, snapshot.dir_mtimes))
+    if not obj_paths:
+        return entries, path_map, preview_map, rir_map
+
+    # Sibling meshes share parent folders, so one listing cache serves the whole scan.
+    listing_cache: Dict[str, DirListing] = {}
+    origin_cache: Dict[str, Markers] = {}
+    scan = functools.partial(
+        _scan_mesh,
+        dataset_root=dataset_root,
+        listing_cache=listing_cache,
+        origin_cache=origin_cache,
+        snapshot=snapshot,
+    )
+    max_workers = min(SCAN_MAX_WORKERS, len(obj_paths))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(scan, obj_paths)
+        for entry, local_path_map, local_preview_map, local_rir_map in results:
+            entries.append(entry)
+            path_map.update(local_path_map)
+            preview_map.update(local_preview_map)
+            rir_map.update(local_rir_map)
 
     return entries, path_map, preview_map, rir_map
 
 
-def write_index_cache(dataset_root: Path, entries: List[MeshEntry]) -> None:
-    """Persist the latest scan for quick inspection or reuse."""
+def _path_maps_from_entries(
+    dataset_root: Path, entries: List[MeshEntry]
+) -> Tuple[MeshMap, PreviewMap, RIRMap]:
+    """Rebuild the id->(path, asset) maps for entries loaded from the cache."""
+    path_map: MeshMap = {}
+    preview_map: PreviewMap = {}
+    rir_map: RIRMap = {}
+    for entry in entries:
+        path_map[entry.id] = (dataset_root / entry.rel_path, entry)
+        for preview in entry.previews:
+            preview_map[preview.id] = (dataset_root / preview.rel_path, preview)
+        for rir in entry.rirs:
+            rir_map[rir.id] = (dataset_root / rir.rel_path, rir)
+    return path_map, preview_map, rir_map
+
+
+def _write_index_cache_now(dataset_root: Path, entries: List[MeshEntry], snapshot: ScanSnapshot) -> None:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     payload = {
         "dataset_root": str(dataset_root),
         "generated_at": time.time(),
         "mesh_count": len(entries),
+        "scan_snapshot": snapshot.as_dict(),
         "entries": [entry.as_dict() for entry in entries],
     }
-    CACHE_INDEX_FILE.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2).encode("utf-8")
 
+    # Write next to the target and swap it in, so readers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=CACHE_INDEX_FILE.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            stream.write(data)
+        os.replace(tmp_name, CACHE_INDEX_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
-def refresh_index() -> List[MeshEntry]:
-    """Rebuild the mesh index and update global state + cache."""
-    global STATE
-    assert STATE is not None
 
-    entries, path_map, preview_map, rir_map = build_mesh_index(STATE.dataset_root)
+class IndexCacheWriter:
+    """Single background thread that persists scans off the request path.
+
+    Only the most recent pending scan is written; older queued ones are superseded.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Tuple[Path, List[MeshEntry], ScanSnapshot]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, dataset_root: Path, entries: List[MeshEntry], snapshot: ScanSnapshot) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mesh-index-cache", daemon=True)
+                self._thread.start()
+        self._queue.put((dataset_root, entries, snapshot))
+
+    def flush(self) -> None:
+        """Block until every submitted scan has been written (or superseded)."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            skipped = 0
+            while True:
+                try:
+                    job = self._queue.get_nowait()
+                    skipped += 1
+                except queue.Empty:
+                    break
+            try:
+                _write_index_cache_now(*job)
+            except Exception as exc:
+                print(f"[mesh-viewer] Could not write index cache ({exc})")
+            finally:
+                for _ in range(skipped + 1):
+                    self._queue.task_done()
+
+
+INDEX_CACHE_WRITER = IndexCacheWriter()
+
+
+def write_index_cache(dataset_root: Path, entries: List[MeshEntry], snapshot: ScanSnapshot) -> None:
+    """Persist the latest scan for quick inspection or reuse (asynchronously).
+
+    snapshot must come from the scan that produced entries; taking it later on the
+    writer would stamp changes made in between as already indexed.
+    """
+    INDEX_CACHE_WRITER.submit(dataset_root, entries, snapshot)
+
+
+def load_index_cache(dataset_root: Path) -> Optional[List[MeshEntry]]:
+    """Return the cached index for dataset_root, or None if it is missing or stale.
+
+    Freshness is judged by the scan snapshot: the mtime of every folder the scan
+    walked (creating, removing or renaming anything in it bumps that) plus the mtime
+    and size of every mesh, origin.npy, preview and RIR file it indexed (catching
+    in-place rewrites, which would leave stale sizes and mtimes in the index). That
+    is one stat per entry instead of a full scan.
+    """
+    try:
+        payload = json.loads(CACHE_INDEX_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if payload.get("dataset_root") != str(dataset_root):
+        return None
+    recorded = payload.get("scan_snapshot")
+    if not isinstance(recorded, dict):
+        # Written before snapshots were recorded; cannot be validated.
+        return None
 
+    try:
+        snapshot = ScanSnapshot(dir_mtimes=dict(recorded["dirs"]), file_stats=dict(recorded["files"]))
+        if str(dataset_root) not in snapshot.dir_mtimes or not snapshot.is_current():
+            return None
+        return [MeshEntry.from_dict(item) for item in payload["entries"]]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _set_index(
+    entries: List[MeshEntry],
+    path_map: MeshMap,
+    preview_map: PreviewMap,
+    rir_map: RIRMap,
+) -> None:
+    assert STATE is not None
+    entries_json = _json_dumps([entry.as_dict() for entry in entries])
     with STATE.lock:
         STATE.entries = entries
+        STATE.entries_json = entries_json
         STATE.path_map = path_map
         STATE.preview_map = preview_map
         STATE.rir_map = rir_map
 
-    write_index_cache(STATE.dataset_root, entries)
+    prefetch_meshes(path_map)
+
+
+@functools.lru_cache(maxsize=None)
+def _prefetch_pool() -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="mesh-prefetch")
+
+
+def _fadvise_willneed(target: Path) -> None:
+    try:
+        fd = os.open(target, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def prefetch_meshes(path_map: MeshMap) -> None:
+    """Ask the kernel to start reading likely-to-be-opened meshes into the page cache.
+
+    Runs on a small background pool and returns immediately; a no-op where
+    posix_fadvise is unavailable (e.g. Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    recent = heapq.nlargest(PREFETCH_MAX_MESHES, path_map.values(), key=lambda ref: ref[1].mtime)
+    pool = _prefetch_pool()
+    for target, _ in recent:
+        pool.submit(_fadvise_willneed, target)
+
+
+def refresh_index() -> List[MeshEntry]:
+    """Rebuild the mesh index and update global state + cache."""
+    assert STATE is not None
+
+    # Filled in by the scan itself, before each folder is listed or file is read.
+    snapshot = ScanSnapshot()
+    entries, path_map, preview_map, rir_map = build_mesh_index(STATE.dataset_root, snapshot)
+    _set_index(entries, path_map, preview_map, rir_map)
+
+    write_index_cache(STATE.dataset_root, entries, snapshot)
     return entries
 
 
-def serialize_entries() -> List[Dict[str, object]]:
+def load_index() -> Tuple[List[MeshEntry], bool]:
+    """Populate global state from the on-disk cache if still fresh, else rescan.
+
+    Returns the entries and whether they came from the cache.
+    """
+    assert STATE is not None
+
+    entries = load_index_cache(STATE.dataset_root)
+    if entries is None:
+        return refresh_index(), False
+
+    _set_index(entries, *_path_maps_from_entries(STATE.dataset_root, entries))
+    return entries, True
+
+
+def serialize_list_payload() -> bytes:
+    """Return the /api/list (and /api/rescan) JSON body, splicing in the pre-serialized entries."""
     assert STATE is not None
     with STATE.lock:
-        return [entry.as_dict() for entry in STATE.entries]
+        mesh_count = len(STATE.entries)
+        entries_json = STATE.entries_json
+
+    header = _json_dumps(
+        {
+            "dataset_root": str(STATE.dataset_root),
+            "mesh_count": mesh_count,
+            "cache_dir": str(CACHE_DIR),
+        }
+    )
+    return header[:-1] + b',"entries":' + entries_json + b"}"
 
 
 class MeshViewerHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP handler that serves the web UI plus mesh data APIs."""
 
+    # Keep connections open between requests; every response sets Content-Length.
+    protocol_version = "HTTP/1.1"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(WEB_DIR), **kwargs)
 
@@ -345,125 +888,198 @@ class MeshViewerHandler(http.server.SimpleHTTPRequestHandler):
         # print("[mesh-viewer]", format % args)
         return
 
-    def _send_json(self, payload: Dict[str, object], status: int = 200) -> None:
-        data = json.dumps(payload).encode("utf-8")
+    def handle_one_request(self) -> None:
+        # Only waiting for the next request (line and headers) is bounded by the
+        # keep-alive timeout; parse_request lifts it for the response.
+        self.connection.settimeout(KEEP_ALIVE_TIMEOUT)
+        super().handle_one_request()
+
+    def parse_request(self) -> bool:
+        parsed = super().parse_request()
+        # Large responses to slow clients may take far longer than the idle timeout.
+        self.connection.settimeout(None)
+        return parsed
+
+    def _send_json_bytes(self, data: bytes, status: int = 200) -> None:
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
 
+    def _send_file_body(self, stream: BinaryIO, size: int) -> None:
+        """Copy an open file to the client, zero-copy via sendfile(2) where available."""
+        # Never send more than the advertised Content-Length.
+        if hasattr(os, "sendfile"):
+            # Headers go straight to the socket, but flush in case wfile ever gets buffered.
+            self.wfile.flush()
+            sent = self.connection.sendfile(stream, count=size)
+        else:
+            # No sendfile (Windows): socket.sendfile's own fallback moves 8 KiB per
+            # send(), so copy in shutil-sized chunks instead.
+            sent = 0
+            while sent < size:
+                chunk = stream.read(min(shutil.COPY_BUFSIZE, size - sent))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                sent += len(chunk)
+        if sent < size:
+            # File shrank mid-transfer: the response is short, so the connection
+            # cannot carry another request.
+            self.close_connection = True
+
+    def _send_indexed_file(self, target: Path, content_type: str, not_found: str) -> None:
+        """Send a file from the index.
+
+        No exists()/stat() path lookups: a file that vanished since the scan surfaces as
+        an open() failure and is reported as 404. Content-Length and the ETag come from
+        an fstat of the open file, so in-place rewrites since the scan are served (and
+        revalidated) correctly. A matching If-None-Match gets a 304.
+        """
+        try:
+            stream = target.open("rb")
+        except OSError:
+            self.send_error(404, not_found)
+            return
+
+        with stream:
+            stat = os.fstat(stream.fileno())
+            file_size = stat.st_size
+            etag = f'W/"{file_size:x}-{stat.st_mtime_ns:x}"'
+            if self._etag_matches(etag):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(file_size))
+            self.send_header("ETag", etag)
+            self.end_headers()
+
+            try:
+                self._send_file_body(stream, file_size)
+            except OSError:
+                # Client disconnected mid-transfer.
+                # The response is incomplete, so drop the connection.
+                self.close_connection = True
+
+    def _etag_matches(self, etag: str) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
     def _send_mesh_file(self, mesh_id: str) -> None:
         assert STATE is not None
         with STATE.lock:
-            target = STATE.path_map.get(mesh_id)
+            ref = STATE.path_map.get(mesh_id)
 
-        if not target or not target.exists():
+        if ref is None:
             self.send_error(404, "Mesh not found")
             return
 
-        self.send_response(200)
-        self.send_header("Content-Type", "text/plain")
-        self.send_header("Content-Length", str(target.stat().st_size))
-        self.end_headers()
-
-        try:
-            with target.open("rb") as stream:
-                shutil.copyfileobj(stream, self.wfile)
-        except (ConnectionResetError, BrokenPipeError):
-            return
+        target, _ = ref
+        self._send_indexed_file(target, "text/plain", "Mesh not found")
 
     def _send_preview_file(self, preview_id: str) -> None:
         assert STATE is not None
         with STATE.lock:
-            target = STATE.preview_map.get(preview_id)
+            ref = STATE.preview_map.get(preview_id)
 
-        if not target or not target.exists():
+        if ref is None:
             self.send_error(404, "Preview not found")
             return
 
-        self.send_response(200)
-        self.send_header("Content-Type", mimetypes.guess_type(str(target))[0] or "application/octet-stream")
-        self.send_header("Content-Length", str(target.stat().st_size))
-        self.end_headers()
-
-        try:
-            with target.open("rb") as stream:
-                shutil.copyfileobj(stream, self.wfile)
-        except (ConnectionResetError, BrokenPipeError):
-            return
+        target, preview = ref
+        self._send_indexed_file(target, preview.content_type, "Preview not found")
 
     def _send_rir_file(self, rir_id: str) -> None:
         assert STATE is not None
         with STATE.lock:
-            target = STATE.rir_map.get(rir_id)
+            ref = STATE.rir_map.get(rir_id)
 
-        if not target or not target.exists():
+        if ref is None:
             self.send_error(404, "RIR not found")
             return
 
-        self.send_response(200)
-        self.send_header("Content-Type", mimetypes.guess_type(str(target))[0] or "application/octet-stream")
-        self.send_header("Content-Length", str(target.stat().st_size))
-        self.end_headers()
+        target, rir = ref
+        self._send_indexed_file(target, rir.content_type, "RIR not found")
 
-        try:
-            with target.open("rb") as stream:
-                shutil.copyfileobj(stream, self.wfile)
-        except (ConnectionResetError, BrokenPipeError):
-            # Client disconnected mid-transfer; safe to ignore.
-            return
+    _FILE_ROUTES = {
+        "mesh": _send_mesh_file,
+        "preview": _send_preview_file,
+        "rir": _send_rir_file,
+    }
 
     def do_GET(self) -> None:  # noqa: N802
         parsed = urllib.parse.urlparse(self.path)
         if parsed.path == "/api/list":
-            payload = {
-                "dataset_root": str(STATE.dataset_root if STATE else ""),
-                "mesh_count": len(STATE.entries) if STATE else 0,
-                "entries": serialize_entries(),
-                "cache_dir": str(CACHE_DIR),
-            }
-            self._send_json(payload)
-            return
-
-        if parsed.path.startswith("/mesh/"):
-            mesh_id = parsed.path.split("/mesh/", 1)[1]
-            self._send_mesh_file(mesh_id)
+            self._send_json_bytes(serialize_list_payload())
             return
 
-        if parsed.path.startswith("/preview/"):
-            preview_id = parsed.path.split("/preview/", 1)[1]
-            self._send_preview_file(preview_id)
-            return
-
-        if parsed.path.startswith("/rir/"):
-            rir_id = parsed.path.split("/rir/", 1)[1]
-            self._send_rir_file(rir_id)
+        # /<route>/<id> for indexed files: one partition + dict lookup.
+        route, sep, asset_id = parsed.path[1:].partition("/")
+        send_file = self._FILE_ROUTES.get(route) if sep else None
+        if send_file is not None:
+            send_file(self, asset_id)
             return
 
         super().do_GET()
 
     def do_POST(self) -> None:  # noqa: N802
+        # Drain any request body so the next request on a keep-alive connection parses cleanly.
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
         parsed = urllib.parse.urlparse(self.path)
         if parsed.path == "/api/rescan":
-            entries = [entry.as_dict() for entry in refresh_index()]
-            payload = {
-                "dataset_root": str(STATE.dataset_root if STATE else ""),
-                "mesh_count": len(entries),
-                "entries": entries,
-                "cache_dir": str(CACHE_DIR),
-            }
-            self._send_json(payload)
+            # refresh_index() leaves the freshly serialized entries in STATE.
+            refresh_index()
+            self._send_json_bytes(serialize_list_payload())
             return
 
         self.send_error(404, "Not found")
 
     def guess_type(self, path: str) -> str:
         # Force JS to use an ES-module friendly MIME type regardless of OS defaults.
-        ctype, _ = mimetypes.guess_type(path)
+        ctype = _guess_content_type(path)
         if ctype == "text/plain" and path.endswith(".js"):
             return "application/javascript"
-        return ctype or "application/octet-stream"
+        return ctype
+
+
+class BoundedHTTPServer(http.server.ThreadingHTTPServer):
+    """ThreadingHTTPServer with a cap on the number of open connections.
+
+    Connections still get their own daemon thread, so idle keep-alive clients never
+    hold up other requests and Ctrl+C exits immediately.
+    """
+
+    def __init__(self, server_address: Tuple[str, int], handler, max_connections: int = SERVER_MAX_CONNECTIONS):
+        super().__init__(server_address, handler)
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def process_request(self, request, client_address) -> None:
+        # Refuse rather than block: a blocked accept loop would not see Ctrl+C on Windows.
+        if not self._slots.acquire(blocking=False):
+            self.shutdown_request(request)
+            return
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address) -> None:
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
 
 
 def parse_args() -> argparse.Namespace:
@@ -472,6 +1088,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--port", type=int, default=8800, help="Port for the local web server")
     parser.add_argument("--no-browser", action="store_true", help="Do not auto-open the browser")
     parser.add_argument("--no-dialog", action="store_true", help="Skip folder selection dialog")
+    parser.add_argument("--rescan", action="store_true", help="Ignore the cached index and rescan the dataset")
     return parser.parse_args()
 
 
@@ -483,20 +1100,22 @@ def main() -> None:
     remember_dataset(dataset_root)
 
     STATE = AppState(dataset_root=dataset_root)
-    entries = refresh_index()
+    if args.rescan:
+        entries, from_cache = refresh_index(), False
+    else:
+        entries, from_cache = load_index()
 
     print("==============================================")
     print(" Mesh Viewer")
     print("----------------------------------------------")
     print(f" Dataset: {dataset_root}")
-    print(f" Meshes : {len(entries)} found (mesh.obj files)")
+    print(f" Meshes : {len(entries)} found (mesh.obj files{', cached index' if from_cache else ''})")
     print(f" Cache  : {CACHE_DIR}")
     print(f" Web UI : http://localhost:{args.port}")
     print("==============================================")
 
     handler = functools.partial(MeshViewerHandler)
-    with socketserver.ThreadingTCPServer(("", args.port), handler) as httpd:
-        httpd.daemon_threads = True
+    with BoundedHTTPServer(("", args.port), handler) as httpd:
         if not args.no_browser:
             threading.Timer(0.5, lambda: webbrowser.open(f"http://localhost:{args.port}")).start()
         try:
@@ -505,6 +1124,7 @@ def main() -> None:
             print("\n[mesh-viewer] Shutting down...")
         finally:
             httpd.server_close()
+            INDEX_CACHE_WRITER.flush()
 
 
 if __name__ == "__main__":